@@ -11,12 +11,11 @@ from satellite import logging as satellite_logging
 from satellite.aliases.store import AliasStore
 from satellite.config import (
     InvalidConfigError,
+    LOG_SINKS,
     SatelliteConfig,
     configure,
     init_satellite_dir,
 )
-from satellite.routes.loaders import LoadError, load_from_yaml
-from satellite.web_application import WebApplication
 
 
 DEFAULT_CONFIG = SatelliteConfig()
@@ -83,6 +82,16 @@ DEFAULT_CONFIG = SatelliteConfig()
     envvar='SATELLITE_LOG_PATH',
     help=('[env:SATELLITE_LOG_PATH] (default:None) Path to a log file.'),
 )
+@click.option(
+    '--log-sink',
+    type=click.Choice(LOG_SINKS),
+    envvar='SATELLITE_LOG_SINK',
+    help=(
+        f'[env:SATELLITE_LOG_SINK] (default:{DEFAULT_CONFIG.log_sink}) '
+        'Where to write logs: into the --log-path file or into syslog. '
+        '--log-path is ignored for syslog.'
+    ),
+)
 @click.option(
     '--silent',
     is_flag=True,
@@ -127,7 +136,11 @@ def main(**kwargs):
     except InvalidConfigError as exc:
         raise click.ClickException(f'Invalid config: {exc}') from exc
 
-    satellite_logging.configure(log_path=config.log_path, silent=config.silent)
+    satellite_logging.configure(
+        log_path=config.log_path,
+        silent=config.silent,
+        log_sink=config.log_sink,
+    )
     logger = logging.getLogger()
 
     db.configure(config.db_path)
@@ -137,6 +150,9 @@ def main(**kwargs):
         raise click.ClickException(exc) from exc
 
     if config.routes_path:
+        # Imported here since route schemas pull in mitmproxy.
+        from satellite.routes.loaders import LoadError, load_from_yaml
+
         with open(config.routes_path, 'r') as stream:
             try:
                 loaded_routes_count = load_from_yaml(stream)
@@ -144,10 +160,14 @@ def main(**kwargs):
                 raise click.ClickException(
                     f'Unable to load routes from file: {exc}'
                 ) from exc
-        logger.info(f'Loaded {loaded_routes_count} routes from routes config file.')
+        logger.info('Loaded %d routes from routes config file.', loaded_routes_count)
 
     deleted_aliases = AliasStore.cleanup()
-    logger.info(f'Deleted {deleted_aliases} expired aliases.')
+    logger.info('Deleted %d expired aliases.', deleted_aliases)
+
+    # Imported here since it pulls in mitmproxy, which is not needed for
+    # CLI help or config errors.
+    from satellite.web_application import WebApplication
 
     app = WebApplication(config)
     app.start()
@@ -1,5 +1,6 @@
 import uuid
 from functools import partial
+from typing import Callable, Dict, Iterable, Optional
 
 from satellite.config import get_config
 from . import AliasGeneratorType, AliasNotFound, AliasStoreType
@@ -15,18 +16,10 @@ def redact(
     generator_type: AliasGeneratorType,
     store_type: AliasStoreType,
 ) -> Alias:
-    make_log_record = None
-    flow_context = ctx.get_flow_context()
-    if flow_context:
-        make_log_record = partial(
-            audit_logs.records.VaultRecordUsageLogRecord,
-            alias_generator=generator_type,
-            flow_id=flow_context.flow.id,
-            phase=flow_context.phase,
-            proxy_mode=ctx.get_proxy_context().mode,
-            route_id=ctx.get_route_context().route.id,
-            record_type=store_type,
-        )
+    make_log_record = _get_log_record_factory(
+        store_type,
+        alias_generator=generator_type,
+    )
 
     alias_store = _get_store(store_type)
     aliases = alias_store.get_by_value(value, generator_type)
@@ -41,14 +34,7 @@ def redact(
             )
         return alias
 
-    generator = get_alias_generator(generator_type)
-    alias_id = str(uuid.uuid4())
-    alias = Alias(
-        id=alias_id,
-        value=value,
-        alias_generator=generator_type,
-        public_alias=generator.generate(value),
-    )
+    alias = _make_alias(value, generator_type)
     alias_store.save(alias)
 
     if make_log_record:
@@ -62,28 +48,115 @@ def redact(
     return alias
 
 
+def redact_many(
+    values: Iterable[str],
+    generator_type: AliasGeneratorType,
+    store_type: AliasStoreType,
+) -> Dict[str, Alias]:
+    values = list(values)
+    make_log_record = _get_log_record_factory(
+        store_type,
+        alias_generator=generator_type,
+    )
+
+    alias_store = _get_store(store_type)
+    aliases = alias_store.get_by_values(values, generator_type)
+    if make_log_record:
+        for alias in aliases.values():
+            audit_logs.emit(
+                make_log_record(
+                    action_type=audit_logs.records.ActionType.DE_DUPE,
+                    record_id=alias.id,
+                )
+            )
+
+    new_aliases = []
+    for value in values:
+        if value not in aliases:
+            aliases[value] = _make_alias(value, generator_type)
+            new_aliases.append(aliases[value])
+
+    if new_aliases:
+        alias_store.save_many(new_aliases)
+
+    if make_log_record:
+        for alias in new_aliases:
+            audit_logs.emit(
+                make_log_record(
+                    action_type=audit_logs.records.ActionType.CREATED,
+                    record_id=alias.id,
+                )
+            )
+
+    return aliases
+
+
 def reveal(alias: str, store_type: AliasStoreType) -> Alias:
     alias_store = _get_store(store_type)
     alias_entity = alias_store.get_by_alias(alias)
     if not alias_entity:
         raise AliasNotFound('Alias was not found!')
 
-    flow_context = ctx.get_flow_context()
-    if flow_context:
+    _emit_reveal_log_record(alias_entity, store_type)
+
+    return alias_entity
+
+
+def reveal_many(
+    aliases: Iterable[str],
+    store_type: AliasStoreType,
+) -> Dict[str, Alias]:
+    # Unknown aliases are omitted in the result.
+    alias_store = _get_store(store_type)
+    alias_entities = alias_store.get_by_aliases(aliases)
+
+    for alias_entity in alias_entities.values():
+        _emit_reveal_log_record(alias_entity, store_type)
+
+    return alias_entities
+
+
+def _emit_reveal_log_record(alias: Alias, store_type: AliasStoreType):
+    make_log_record = _get_log_record_factory(
+        store_type,
+        alias_generator=alias.alias_generator,
+    )
+    if make_log_record:
         audit_logs.emit(
-            audit_logs.records.VaultRecordUsageLogRecord(
-                alias_generator=alias_entity.alias_generator,
-                flow_id=flow_context.flow.id,
-                phase=flow_context.phase,
-                proxy_mode=ctx.get_proxy_context().mode,
-                route_id=ctx.get_route_context().route.id,
+            make_log_record(
                 action_type=audit_logs.records.ActionType.RETRIEVED,
-                record_type=store_type,
-                record_id=alias_entity.id,
+                record_id=alias.id,
             )
         )
 
-    return alias_entity
+
+def _get_log_record_factory(
+    store_type: AliasStoreType,
+    **kwargs,
+) -> Optional[Callable]:
+    flow_context = ctx.get_flow_context()
+    if not flow_context:
+        return None
+
+    return partial(
+        audit_logs.records.VaultRecordUsageLogRecord,
+        flow_id=flow_context.flow.id,
+        phase=flow_context.phase,
+        proxy_mode=ctx.get_proxy_context().mode,
+        route_id=ctx.get_route_context().route.id,
+        record_type=store_type,
+        **kwargs,
+    )
+
+
+def _make_alias(value: str, generator_type: AliasGeneratorType) -> Alias:
+    generator = get_alias_generator(generator_type)
+    return Alias(
+        id=str(uuid.uuid4()),
+        value=value,
+        alias_generator=generator_type,
+        public_alias=generator.generate(value),
+    )
 
 
 def _get_store(store_type: AliasStoreType) -> AliasStore:
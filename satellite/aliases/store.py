@@ -1,5 +1,5 @@
 from datetime import datetime, timedelta
-from typing import List, Optional
+from typing import Dict, Iterable, Iterator, List, Optional
 
 from sqlalchemy.orm.query import Query
 
@@ -8,6 +8,11 @@ from satellite.db.models import Alias
 from . import AliasGeneratorType
 
 
+# Max number of values in a single IN clause. Keeps queries below SQLite's
+# bound parameters limit (999 before SQLite 3.32).
+IN_BATCH_SIZE = 500
+
+
 class AliasStore:
     def __init__(self, ttl: int = None):
         self._ttl = ttl
@@ -24,9 +29,31 @@ class AliasStore:
             query = query.filter(Alias.alias_generator == generator_type)
         return query.order_by('created_at').all()
 
+    def get_by_values(
+        self,
+        values: Iterable[str],
+        generator_type: AliasGeneratorType = None,
+    ) -> Dict[str, Alias]:
+        # Returns the oldest alias for every found value.
+        aliases = {}
+        for batch in _batches(set(values)):
+            query = self._query().filter(Alias.value.in_(batch))
+            if generator_type is not None:
+                query = query.filter(Alias.alias_generator == generator_type)
+            for alias in query.order_by('created_at'):
+                aliases.setdefault(alias.value, alias)
+        return aliases
+
     def get_by_alias(self, alias: str) -> Optional[Alias]:
         return self._query().filter(Alias.public_alias == alias).first()
 
+    def get_by_aliases(self, aliases: Iterable[str]) -> Dict[str, Alias]:
+        return {
+            alias.public_alias: alias
+            for batch in _batches(set(aliases))
+            for alias in self._query().filter(Alias.public_alias.in_(batch))
+        }
+
     def _query(self) -> Query:
         query = get_session().query(Alias)
         if self.is_persistent:
@@ -34,10 +61,14 @@ class AliasStore:
         return query.filter(Alias.expires_at >= datetime.utcnow())
 
     def save(self, alias: Alias):
+        self.save_many([alias])
+
+    def save_many(self, aliases: Iterable[Alias]):
         session = get_session()
-        if not self.is_persistent:
-            alias.expires_at = datetime.utcnow() + timedelta(seconds=self._ttl)
-        session.add(alias)
+        for alias in aliases:
+            if not self.is_persistent:
+                alias.expires_at = datetime.utcnow() + timedelta(seconds=self._ttl)
+            session.add(alias)
         session.commit()
 
     @staticmethod
@@ -48,3 +79,9 @@ class AliasStore:
         )
         session.commit()
         return result
+
+
+def _batches(items: Iterable[str]) -> Iterator[List[str]]:
+    items = list(items)
+    for start in range(0, len(items), IN_BATCH_SIZE):
+        yield items[start : start + IN_BATCH_SIZE]
@@ -0,0 +1,40 @@
+import asyncio
+from typing import Callable, List
+
+from .records import AuditLogRecord
+
+
+class AuditLogBuffer:
+    # Accumulates records and passes them to the flush callback in batches:
+    # when the buffer is full or flush_interval seconds after the first
+    # buffered record. Must be used from the event loop thread.
+    def __init__(
+        self,
+        flush_callback: Callable[[List[AuditLogRecord]], None],
+        capacity: int = 1024,
+        flush_interval: float = 0.05,
+    ):
+        self._flush_callback = flush_callback
+        self._capacity = capacity
+        self._flush_interval = flush_interval
+        self._records: List[AuditLogRecord] = []
+        self._flush_handle: asyncio.TimerHandle = None
+
+    def add(self, record: AuditLogRecord):
+        self._records.append(record)
+        if len(self._records) >= self._capacity:
+            self.flush()
+        elif not self._flush_handle:
+            self._flush_handle = asyncio.get_event_loop().call_later(
+                self._flush_interval,
+                self.flush,
+            )
+
+    def flush(self):
+        if self._flush_handle:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+
+        if self._records:
+            records, self._records = self._records, []
+            self._flush_callback(records)
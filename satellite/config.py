@@ -4,7 +4,16 @@ from pathlib import Path
 from typing import Optional
 
 import marshmallow_dataclass
-from ruamel.yaml import YAML
+import yaml
+from marshmallow import validate
+
+from . import file_cache
+
+
+try:
+    from yaml import CSafeLoader as YAMLLoader
+except ImportError:  # PyYAML is built without libyaml
+    from yaml import SafeLoader as YAMLLoader
 
 
 SATELLITE_DIR = Path(
@@ -16,6 +25,8 @@ SATELLITE_DIR = Path(
 DEFAULT_CONFIG_PATH = SATELLITE_DIR / 'config.yml'
 DEFAULT_DB_PATH = SATELLITE_DIR / 'db.sqlite'
 
+LOG_SINKS = ('file', 'syslog')
+
 
 @dataclasses.dataclass(frozen=True)
 class SatelliteConfig:
@@ -23,6 +34,10 @@ class SatelliteConfig:
     debug: bool = False
     forward_proxy_port: int = 9099
     log_path: Optional[str] = None
+    log_sink: str = dataclasses.field(
+        default='file',
+        metadata={'validate': validate.OneOf(LOG_SINKS)},
+    )
     reverse_proxy_port: int = 9098
     routes_path: Optional[str] = None
     silent: bool = False
@@ -63,9 +78,18 @@ def _get_params_from_config_file(config_path: str = None) -> dict:
     for path in filter(None, [config_path, DEFAULT_CONFIG_PATH]):
         path = Path(path).expanduser().resolve()
         if path.exists():
+            cache_path = path.with_name(f'{path.name}.cache.json')
+            stat = path.stat()
+            # Size guards against edits that keep mtime (e.g. cp -p, coarse
+            # timestamps).
+            cache_key = [str(path), stat.st_mtime_ns, stat.st_size]
+            config = file_cache.load(cache_path, cache_key)
+            if config is not None:
+                return config
+
             try:
                 with open(path) as stream:
-                    config = YAML().load(stream) or {}
+                    config = yaml.load(stream, Loader=YAMLLoader) or {}
                 if not isinstance(config, dict):
                     raise TypeError(
                         f'Expecting mapping, but got {type(config).__name__}.'
@@ -73,6 +97,8 @@ def _get_params_from_config_file(config_path: str = None) -> dict:
             except Exception as exc:
                 raise InvalidConfigError(str(exc)) from exc
 
+            file_cache.dump(cache_path, cache_key, config)
+
             return config
 
     return {}
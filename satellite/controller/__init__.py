@@ -1,5 +1,5 @@
 import json
-from functools import wraps
+from functools import lru_cache, wraps
 from typing import Any, Type
 
 from marshmallow import Schema
@@ -14,13 +14,9 @@ class BaseHandler(RequestHandler):
     def set_default_headers(self):
         self.set_header('Access-Control-Allow-Origin', '*')
         self.set_header('Access-Control-Allow-Headers', 'Accept, Content-Type')
-        methods = [
-            method.upper()
-            for method in ['delete', 'get', 'head', 'options', 'patch', 'post', 'put']
-            if getattr(self, method).__name__ != '_unimplemented_method'
-        ]
+        methods = _get_allowed_methods(type(self))
         if methods:
-            self.set_header('Access-Control-Allow-Methods', ', '.join(methods))
+            self.set_header('Access-Control-Allow-Methods', methods)
 
     def json(self):
         content_type = self.request.headers.get('Content-Type', '')
@@ -57,13 +53,25 @@ class BaseHandler(RequestHandler):
 
         self.set_status(exc.status_code, exc.reason)
         self.set_header('Content-type', 'application/json')
-        self.finish(ErrorResponseSchema().dumps(exc))
+        self.finish(_error_response_schema.dumps(exc))
 
     def finish_empty_ok(self):
         self.set_status(204, 'Success')
         self.finish()
 
 
+@lru_cache(maxsize=None)
+def _get_allowed_methods(handler_cls: Type[BaseHandler]) -> str:
+    return ', '.join(
+        method.upper()
+        for method in ['delete', 'get', 'head', 'options', 'patch', 'post', 'put']
+        if getattr(handler_cls, method).__name__ != '_unimplemented_method'
+    )
+
+
+_error_response_schema = ErrorResponseSchema()
+
+
 def apply_response_schema(schema_cls: Type[Schema], many: bool = False):
     def decorator(handler_method):
         @wraps(handler_method)
@@ -1,7 +1,8 @@
 from . import BaseHandler, apply_request_schema, apply_response_schema
 from .exceptions import NotFoundError, ValidationError
 from ..aliases import AliasNotFound, AliasStoreType
-from ..aliases.manager import redact, reveal
+from ..aliases.manager import redact_many, reveal, reveal_many
+from ..db.models.alias import Alias
 from ..schemas.aliases import (
     AliasResponseSchema,
     AliasesResponseSchema,
@@ -29,10 +30,19 @@ class AliasesHandler(BaseHandler):
                     application/json:
                         schema: AliasResponseSchema
         """
+        values_by_format = {}
+        for item in validated_data['data']:
+            values_by_format.setdefault(item['format'], []).append(item['value'])
+
+        aliases_by_format = {
+            format: redact_many(values, format, STORAGE_TYPE)
+            for format, values in values_by_format.items()
+        }
+
         results = []
         for item in validated_data['data']:
             value, format = item['value'], item['format']
-            alias = redact(value, format, STORAGE_TYPE)
+            alias = aliases_by_format[format][value]
             results.append(
                 {
                     'aliases': [{'alias': alias.public_alias, 'format': format}],
@@ -65,15 +75,17 @@ class AliasesHandler(BaseHandler):
         if not aliases:
             raise ValidationError('Missing required parameter: "q"')
 
+        public_aliases = set(aliases.split(','))
+        alias_entities = reveal_many(public_aliases, STORAGE_TYPE)
+
         reveal_data = {}
         errors = []
-        for public_alias in set(aliases.split(',')):
-            try:
-                reveal_result = _reveal(public_alias)
-            except AliasNotFound:
-                errors.append({'message': f'Unknown alias: {public_alias}'})
+        for public_alias in public_aliases:
+            alias = alias_entities.get(public_alias)
+            if alias:
+                reveal_data[public_alias] = _make_reveal_result(alias)
             else:
-                reveal_data[public_alias] = reveal_result
+                errors.append({'message': f'Unknown alias: {public_alias}'})
 
         result = {}
         if reveal_data:
@@ -115,8 +127,11 @@ class AliasHandler(BaseHandler):
         return {'data': [reveal_result]}
 
 
-def _reveal(public_alias: str) -> str:
-    alias = reveal(public_alias, STORAGE_TYPE)
+def _reveal(public_alias: str) -> dict:
+    return _make_reveal_result(reveal(public_alias, STORAGE_TYPE))
+
+
+def _make_reveal_result(alias: Alias) -> dict:
     return {
         'aliases': [
             {
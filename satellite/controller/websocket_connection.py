@@ -15,7 +15,9 @@ class ClientConnection(WebSocketEventBroadcaster):
         return True
 
     @classmethod
-    async def process_proxy_event(cls, event):
+    def process_proxy_event_nowait(cls, event):
+        # Event processing doesn't actually await anything, so it is done
+        # right away without wrapping it into a task.
         cls._process_proxy_event(event)
 
     @singledispatchmethod
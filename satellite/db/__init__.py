@@ -77,6 +77,9 @@ def update_model(model: Base, data: dict, exclude_fields=None):
 def set_sqlite_pragma(dbapi_connection, connection_record):
     cursor = dbapi_connection.cursor()
     cursor.execute('PRAGMA foreign_keys=ON')
+    # In WAL mode NORMAL sync is corruption-safe and fsyncs on checkpoints only.
+    cursor.execute('PRAGMA journal_mode=WAL')
+    cursor.execute('PRAGMA synchronous=NORMAL')
     cursor.close()
 
 
@@ -0,0 +1,40 @@
+import json
+import os
+from contextlib import suppress
+from pathlib import Path
+from typing import Any, Optional
+
+
+# Cache file format: the first line is a JSON-encoded cache key, the rest of
+# the file is JSON-encoded data.
+
+
+def load(cache_path: Path, key: Any) -> Optional[Any]:
+    try:
+        with open(cache_path) as stream:
+            if stream.readline().rstrip('\n') != _dump_key(key):
+                return None
+            return json.load(stream)
+    except (OSError, ValueError):
+        return None
+
+
+def dump(cache_path: Path, key: Any, data: Any):
+    # Failures are ignored since the cache is an optimization only.
+    try:
+        content = f'{_dump_key(key)}\n{json.dumps(data)}'
+    except (TypeError, ValueError):
+        return
+
+    cache_path = Path(cache_path)
+    tmp_path = cache_path.with_name(f'.{cache_path.name}.{os.getpid()}')
+    try:
+        tmp_path.write_text(content)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        with suppress(OSError):
+            tmp_path.unlink()
+
+
+def _dump_key(key: Any) -> str:
+    return json.dumps(key, sort_keys=True)
@@ -1,22 +1,62 @@
+import atexit
 import logging
+import logging.handlers
+import queue
+import socket
+from pathlib import Path
+from threading import Event, Thread
 
 
 LOG_FORMAT = '[%(levelname)s][%(asctime)s][%(processName)s][%(threadName)s] %(message)s'
+# Syslog adds timestamps by itself
+SYSLOG_FORMAT = (
+    'vgs-satellite[%(process)d]: '
+    '[%(levelname)s][%(processName)s][%(threadName)s] %(message)s'
+)
 
 
-def configure(log_path: str = None, silent: bool = False):
+def configure(log_path: str = None, silent: bool = False, log_sink: str = 'file'):
     root = logging.getLogger()
-    formatter = logging.Formatter(LOG_FORMAT)
+    formatter = Formatter()
+
+    handlers = []
+    warnings = []
 
     if not silent:
         stream_handler = logging.StreamHandler()
         stream_handler.setFormatter(formatter)
-        root.addHandler(stream_handler)
+        handlers.append(stream_handler)
 
-    if log_path:
-        file_handler = logging.FileHandler(log_path)
+    if log_sink == 'syslog':
+        syslog_address = _get_syslog_address()
+        if not isinstance(syslog_address['address'], str):
+            # Nothing reports an error if there is no syslog daemon listening
+            warnings.append(
+                'Local syslog socket is not found, sending logs to '
+                'localhost:514 via UDP.'
+            )
+        if log_path:
+            warnings.append(f'Log path {log_path} is ignored for syslog log sink.')
+        syslog_handler = logging.handlers.SysLogHandler(**syslog_address)
+        syslog_handler.setFormatter(logging.Formatter(SYSLOG_FORMAT))
+        handlers.append(syslog_handler)
+    elif log_path:
+        file_handler = BufferedFileHandler(log_path)
         file_handler.setFormatter(formatter)
-        root.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    if handlers:
+        # Actual I/O is done by the listener thread so logging calls made
+        # from the event loop thread never block on stderr/disk writes.
+        log_queue = queue.SimpleQueue()
+        root.addHandler(logging.handlers.QueueHandler(log_queue))
+
+        global _listener
+        _listener = logging.handlers.QueueListener(
+            log_queue,
+            *handlers,
+            respect_handler_level=True,
+        )
 
     if not root.handlers:
         root.addHandler(logging.NullHandler())
@@ -24,3 +64,117 @@ def configure(log_path: str = None, silent: bool = False):
     logging.getLogger('alembic').setLevel(logging.WARNING)
 
     root.setLevel(logging.INFO)
+
+    if _listener:
+        _listener.start()
+        atexit.register(stop)
+
+    for warning in warnings:
+        root.warning(warning)
+
+
+def stop():
+    global _listener
+    if _listener:
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+
+
+def _get_syslog_address() -> dict:
+    for path in ['/dev/log', '/var/run/syslog']:
+        if Path(path).exists():
+            return {'address': path}
+    return {'address': ('localhost', 514), 'socktype': socket.SOCK_DGRAM}
+
+
+class Formatter(logging.Formatter):
+    # Produces LOG_FORMAT output with an f-string instead of %-formatting of
+    # the record dict. Exception and stack info are still handled by the
+    # base class.
+    def __init__(self):
+        super().__init__(LOG_FORMAT)
+
+    def formatMessage(self, record: logging.LogRecord) -> str:
+        return (
+            f'[{record.levelname}][{record.asctime}]'
+            f'[{record.processName}][{record.threadName}] {record.message}'
+        )
+
+
+class BufferedFileHandler(logging.handlers.MemoryHandler):
+    # The buffer is flushed when it is full, on error records and
+    # periodically by the flush timer. Buffered records are written to the
+    # file stream and then the stream is flushed once per batch.
+    def __init__(
+        self,
+        log_path: str,
+        capacity: int = 512,
+        flush_interval: float = 0.25,
+    ):
+        super().__init__(
+            capacity=capacity,
+            flushLevel=logging.ERROR,
+            target=BatchFileHandler(log_path),
+            flushOnClose=True,
+        )
+        self._flush_timer = FlushTimer(self, flush_interval)
+        self._flush_timer.start()
+
+    def setFormatter(self, fmt: logging.Formatter):
+        super().setFormatter(fmt)
+        self.target.setFormatter(fmt)
+
+    def flush(self):
+        self.acquire()
+        try:
+            if self.target and self.buffer:
+                for record in self.buffer:
+                    self.target.handle(record)
+                self.buffer.clear()
+                self.target.flush_stream()
+        finally:
+            self.release()
+
+    def close(self):
+        self._flush_timer.stop()
+        target = self.target
+        super().close()
+        if target:
+            target.close()
+
+
+class BatchFileHandler(logging.FileHandler):
+    # Doesn't flush the stream after every record. The stream is flushed by
+    # flush_stream() or on close.
+    def flush(self):
+        pass
+
+    def flush_stream(self):
+        self.acquire()
+        try:
+            if self.stream and hasattr(self.stream, 'flush'):
+                self.stream.flush()
+        finally:
+            self.release()
+
+
+class FlushTimer(Thread):
+    def __init__(self, handler: logging.Handler, interval: float):
+        super().__init__(name='LogFlushTimer', daemon=True)
+        self._handler = handler
+        self._interval = interval
+        self._should_stop = Event()
+
+    def run(self):
+        while not self._should_stop.wait(self._interval):
+            self._handler.flush()
+
+    def stop(self):
+        self._should_stop.set()
+        if self.is_alive():
+            self.join()
+
+
+_listener: logging.handlers.QueueListener = None
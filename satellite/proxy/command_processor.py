@@ -102,7 +102,7 @@ class ProxyCommandProcessor:
                     raise exceptions.FlowUpdateError('Unknown flow field.')
 
         except Exception as exc:
-            logger.error(f'Unable to update flow {flow.id}: {exc}')
+            logger.error('Unable to update flow %s: %s', flow.id, exc)
             flow.revert()
             raise
 
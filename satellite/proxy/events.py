@@ -1,5 +1,6 @@
 from dataclasses import dataclass
 from logging import LogRecord
+from typing import List
 
 from . import ProxyMode
 from ..audit_logs.records import AuditLogRecord
@@ -31,5 +32,5 @@ class LogEvent(ProxyEvent):
 
 
 @dataclass
-class AuditLogEvent(ProxyEvent):
-    record: AuditLogRecord
+class AuditLogsEvent(ProxyEvent):
+    records: List[AuditLogRecord]
@@ -65,8 +65,9 @@ class ProxyManager:
                 # should be started sequentially.
                 proxy.process.wait_proxy_started(5)
                 logger.info(
-                    f'Started proxy({proxy.process.mode.value}) '
-                    f'at {proxy.process.port} port.'
+                    'Started proxy(%s) at %d port.',
+                    proxy.process.mode.value,
+                    proxy.process.port,
                 )
 
             self._event_listener = ProxyEventListener(
@@ -89,8 +90,8 @@ class ProxyManager:
                     self._send_proxy_command(proxy, commands.StopCommand(), timeout=5)
                 except exceptions.ProxyCommandTimeoutError:
                     logger.error(
-                        f'Unable to gracefully stop {mode.value} proxy. '
-                        'Killing it now.'
+                        'Unable to gracefully stop %s proxy. Killing it now.',
+                        mode.value,
                     )
                     proxy.process.kill()
                     proxy.process.join()
@@ -200,8 +201,9 @@ class ProxyManager:
         logger.handle(event.record)
 
     @_process_event.register
-    def _(self, event: events.AuditLogEvent):
-        self._audit_logs.save(event.record)
+    def _(self, event: events.AuditLogsEvent):
+        for record in event.records:
+            self._audit_logs.save(record)
 
 
 class ProxyEventListener(Thread):
@@ -44,7 +44,9 @@ class ProxyEventsAddon:
 
     def log(self, entry: LogEntry):
         level = self.PROXY_LOG_LEVELS.get(entry.level)
-        if level is not None:
+        # Every log record is sent to the manager process, so drop disabled
+        # ones as early as possible.
+        if level is not None and logger.isEnabledFor(level):
             logger.log(level, entry.msg)
 
 
@@ -6,7 +6,7 @@ from functools import partial
 from multiprocessing import Event as MPEvent, Process, Queue
 from multiprocessing.connection import Connection
 from threading import Event as ThreadingEvent, Thread
-from typing import Any, Callable
+from typing import Any, Callable, List
 
 import blinker
 from mitmproxy.addons.view import View
@@ -17,6 +17,7 @@ from .command_processor import ProxyCommandProcessor
 from .commands import ProxyCommand
 from .master import ProxyMaster
 from .. import audit_logs
+from ..audit_logs.buffer import AuditLogBuffer
 from ..ctx import ProxyContext, set_context
 from ..flows import get_flow_state
 
@@ -44,6 +45,7 @@ class ProxyProcess(Process):
         self._should_stop: ThreadingEvent = None
         self._command_listener: Thread = None
         self._command_processor: ProxyCommandProcessor = None
+        self._audit_log_buffer: AuditLogBuffer = None
 
     @property
     def mode(self):
@@ -86,7 +88,10 @@ class ProxyProcess(Process):
 
         signal.signal(signal.SIGINT, signal.SIG_IGN)
 
-        audit_logs.subscribe(self._sig_audit_log)
+        # Audit logs are sent to the manager in batches to avoid per-record
+        # queue writes.
+        self._audit_log_buffer = AuditLogBuffer(self._send_audit_logs)
+        audit_logs.subscribe(self._audit_log_buffer.add)
 
         self.master.run()
 
@@ -96,6 +101,7 @@ class ProxyProcess(Process):
         logger.info('Stopping proxy.')
         self._should_stop.set()
         self.master.shutdown()
+        self._audit_log_buffer.flush()
         logger.info('Stopped proxy.')
         self._event_queue.close()
         self._event_queue.join_thread()
@@ -141,11 +147,11 @@ class ProxyProcess(Process):
     def _sig_proxy_started(self, _):
         self._started_event.set()
 
-    def _sig_audit_log(self, record: audit_logs.records.AuditLogRecord):
+    def _send_audit_logs(self, records: List[audit_logs.records.AuditLogRecord]):
         self._event_queue.put_nowait(
-            events.AuditLogEvent(
-                proxy_mode=record.proxy_mode,
-                record=record,
+            events.AuditLogsEvent(
+                proxy_mode=self.mode,
+                records=records,
             )
         )
 
@@ -1,5 +1,7 @@
 import logging
+import time
 from copy import copy
+from typing import Optional, Tuple
 
 from mitmproxy.proxy.config import ProxyConfig
 from mitmproxy.proxy.server import (
@@ -15,16 +17,27 @@ from ..routes import manager as route_manager
 logger = logging.getLogger()
 
 
+# Routes are managed by the web app process, so changes made there can be
+# picked up by the proxy process with this delay only.
+UPSTREAM_CACHE_TTL = 1  # seconds
+
+
 class ProxyServer(BaseProxyServer):
+    def __init__(self, config: ProxyConfig):
+        super().__init__(config)
+        # (upstream, expiration timestamp)
+        self._upstream_cache = None
+        # Only the current upstream's config is kept since there is a single
+        # inbound upstream at a time.
+        self._config_cache: Tuple[str, ProxyConfig] = None
+
     def handle_client_connection(self, conn, client_address):
         config = self.config
 
         if get_proxy_context().mode == ProxyMode.REVERSE:
             upstream = self._get_upstream()
             if upstream:
-                options = copy(self.config.options)
-                options.mode = f'reverse:{upstream}'
-                config = ProxyConfig(options)
+                config = self._get_reverse_config(upstream)
 
         handler = ConnectionHandler(
             conn,
@@ -34,6 +47,29 @@ class ProxyServer(BaseProxyServer):
         )
         handler.handle()
 
-    def _get_upstream(self):
-        routes = route_manager.get_all_by_type(is_outbound=False)
-        return routes and routes[0].destination_override_endpoint
+    def _get_upstream(self) -> Optional[str]:
+        now = time.monotonic()
+
+        if self._upstream_cache:
+            upstream, expires_at = self._upstream_cache
+            if now < expires_at:
+                return upstream
+
+        upstream = route_manager.get_inbound_upstream()
+        self._upstream_cache = (upstream, now + UPSTREAM_CACHE_TTL)
+        return upstream
+
+    def _get_reverse_config(self, upstream: str) -> ProxyConfig:
+        if self._config_cache:
+            cached_upstream, config = self._config_cache
+            if cached_upstream == upstream:
+                return config
+
+        config = self._build_reverse_config(upstream)
+        self._config_cache = (upstream, config)
+        return config
+
+    def _build_reverse_config(self, upstream: str) -> ProxyConfig:
+        options = copy(self.config.options)
+        options.mode = f'reverse:{upstream}'
+        return ProxyConfig(options)
@@ -1,6 +1,8 @@
 import logging
 import re
-from typing import List
+from typing import List, Optional
+
+from sqlalchemy import or_
 
 from .expressions import CompositeExpression, ExpressionError
 from ..db import get_session, update_model
@@ -30,6 +32,23 @@ def get_all_by_type(is_outbound: bool) -> List[Route]:
     return [route for route in get_all() if route.is_outbound() is is_outbound]
 
 
+def get_inbound_upstream() -> Optional[str]:
+    session = get_session()
+    # Hack to handle transaction isolation. Proper fix is needed (SAT-148).
+    session.commit()
+    return (
+        session.query(Route.destination_override_endpoint)
+        .filter(
+            or_(
+                Route.destination_override_endpoint.is_(None),
+                Route.destination_override_endpoint != '*',
+            )
+        )
+        .limit(1)
+        .scalar()
+    )
+
+
 def get(route_id: str) -> Route:
     return get_session().query(Route).filter(Route.id == route_id).first()
 
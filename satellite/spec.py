@@ -1,4 +1,9 @@
-from typing import Callable, List, Tuple
+import json
+import os
+import sys
+from importlib import metadata
+from pathlib import Path
+from typing import Callable, Optional, Sequence, Tuple, Union
 
 from apispec import APISpec
 from apispec.ext.marshmallow import (
@@ -6,10 +11,25 @@ from apispec.ext.marshmallow import (
     OpenAPIConverter,
 )
 from apispec.ext.marshmallow.common import resolve_schema_instance
-from apispec_webframeworks.tornado import TornadoPlugin
 from marshmallow.fields import Field
 from marshmallow_enum import EnumField
 from marshmallow_oneofschema import OneOfSchema
+from tornado.web import URLSpec
+
+from . import file_cache
+
+
+Handlers = Sequence[Union[URLSpec, Tuple[str, Callable]]]
+
+# Distributions shaping the spec. Their versions are part of the spec cache key.
+SPEC_DEPENDENCIES = (
+    'apispec',
+    'apispec-webframeworks',
+    'marshmallow',
+    'marshmallow-dataclass',
+    'marshmallow-enum',
+    'marshmallow-oneofschema',
+)
 
 
 class Converter(OpenAPIConverter):
@@ -56,7 +76,10 @@ class MarshmallowPlugin(BaseMarshmallowPlugin):
     Converter = Converter
 
 
-def build_openapi_spec(handlers: List[Tuple[str, Callable]]) -> APISpec:
+def build_openapi_spec(handlers: Handlers) -> APISpec:
+    # Not needed when the spec is loaded from the cache.
+    from apispec_webframeworks.tornado import TornadoPlugin
+
     spec = APISpec(
         title='VGS Satellite management API',
         version='1.0.0',
@@ -69,3 +92,61 @@ def build_openapi_spec(handlers: List[Tuple[str, Callable]]) -> APISpec:
         spec.path(urlspec=urlspec)
 
     return spec
+
+
+def load_openapi_spec(
+    handlers: Handlers,
+    cache_path: Path = None,
+) -> dict:
+    cache_key = cache_path and _get_spec_cache_key(handlers)
+    if cache_key:
+        spec = file_cache.load(cache_path, cache_key)
+        if spec is not None:
+            return spec
+
+    # JSON round trip makes a fresh spec identical to a cached one
+    # (e.g. response codes become strings).
+    spec = json.loads(json.dumps(build_openapi_spec(handlers).to_dict()))
+
+    if cache_key:
+        file_cache.dump(cache_path, cache_key, spec)
+
+    return spec
+
+
+def _get_spec_cache_key(handlers: Handlers) -> Optional[dict]:
+    # The spec is built from handlers docstrings and schemas, so any change
+    # of the app sources invalidates the cache.
+    package = __name__.partition('.')[0]
+    try:
+        sources = sorted(
+            [name, os.stat(module.__file__).st_mtime_ns]
+            for name, module in list(sys.modules.items())
+            if name.partition('.')[0] == package and getattr(module, '__file__', None)
+        )
+    except OSError:
+        return None
+
+    return {
+        'dependencies': {name: _get_version(name) for name in SPEC_DEPENDENCIES},
+        'handlers': [
+            [urlspec.regex.pattern, _get_qualname(urlspec.handler_class)]
+            for urlspec in map(_as_urlspec, handlers)
+        ],
+        'sources': sources,
+    }
+
+
+def _get_version(distribution: str) -> Optional[str]:
+    try:
+        return metadata.version(distribution)
+    except metadata.PackageNotFoundError:  # E.g. no metadata in a frozen app
+        return None
+
+
+def _as_urlspec(urlspec: Union[URLSpec, tuple]) -> URLSpec:
+    return urlspec if isinstance(urlspec, URLSpec) else URLSpec(*urlspec)
+
+
+def _get_qualname(cls: type) -> str:
+    return f'{cls.__module__}.{cls.__qualname__}'
@@ -189,3 +189,27 @@ def test_reveal(
             route_id='41265f94-3ea5-46ad-b5f5-26221a41db34',
         )
     )
+
+
+def test_redact_many():
+    existing_alias = alias_manager.redact(
+        'existing value',
+        generator_type=AliasGeneratorType.UUID,
+        store_type=AliasStoreType.PERSISTENT,
+    )
+
+    aliases = alias_manager.redact_many(
+        ['existing value', 'new value', 'new value'],
+        generator_type=AliasGeneratorType.UUID,
+        store_type=AliasStoreType.PERSISTENT,
+    )
+
+    assert list(aliases) == ['existing value', 'new value']
+    assert aliases['existing value'] == existing_alias
+    assert aliases['new value'].value == 'new value'
+
+    revealed_aliases = alias_manager.reveal_many(
+        [existing_alias.public_alias, 'unknown'],
+        store_type=AliasStoreType.PERSISTENT,
+    )
+    assert revealed_aliases == {existing_alias.public_alias: existing_alias}
@@ -1,4 +1,5 @@
 import uuid
+from datetime import datetime, timedelta
 
 from satellite.aliases.generators import AliasGeneratorType
 from satellite.aliases.store import AliasStore
@@ -14,7 +15,7 @@ def make_alias(store: bool, **params) -> Alias:
     if store:
         session = get_session()
         session.add(alias)
-        session.commit()
+        session.flush()
     return alias
 
 
@@ -38,6 +39,39 @@ def test_get_by_value():
     assert store.get_by_value(value[::-1]) == []
 
 
+def test_get_by_values():
+    value1, value2 = str(uuid.uuid4()), str(uuid.uuid4())
+    alias1 = make_alias(True, value=value1)
+    make_alias(True, value=value1)
+    alias2 = make_alias(
+        True,
+        value=value2,
+        alias_generator=AliasGeneratorType.RAW_UUID,
+    )
+
+    store = AliasStore()
+    assert store.get_by_values([value1, value2, 'unknown']) == {
+        value1: alias1,
+        value2: alias2,
+    }
+    assert store.get_by_values([value1, value2], AliasGeneratorType.UUID) == {
+        value1: alias1,
+    }
+    assert store.get_by_values([]) == {}
+
+
+def test_get_by_values_batches(monkeypatch):
+    monkeypatch.setattr('satellite.aliases.store.IN_BATCH_SIZE', 2)
+    aliases = [make_alias(True) for _ in range(5)]
+    store = AliasStore()
+    assert store.get_by_values(alias.value for alias in aliases) == {
+        alias.value: alias for alias in aliases
+    }
+    assert store.get_by_aliases(alias.public_alias for alias in aliases) == {
+        alias.public_alias: alias for alias in aliases
+    }
+
+
 def test_get_by_alias():
     alias = make_alias(True)
     store = AliasStore()
@@ -45,6 +79,18 @@ def test_get_by_alias():
     assert store.get_by_alias(alias.public_alias) == alias
 
 
+def test_get_by_aliases():
+    alias1 = make_alias(True)
+    alias2 = make_alias(True)
+    store = AliasStore()
+    assert store.get_by_aliases(
+        [alias1.public_alias, alias2.public_alias, alias1.value]
+    ) == {
+        alias1.public_alias: alias1,
+        alias2.public_alias: alias2,
+    }
+
+
 def test_save():
     alias = make_alias(False)
     store = AliasStore()
@@ -88,19 +134,17 @@ def test_get_by_alias_with_ttl_expired():
 def test_cleanup():
     session = get_session()
     session.query(Alias).delete()
-    session.commit()
 
-    persistent_store = AliasStore()
+    now = datetime.utcnow()
     alias1 = make_alias(False)
-    persistent_store.save(alias1)
+    alias2 = make_alias(False, expires_at=now + timedelta(seconds=60))
+    alias3 = make_alias(False, expires_at=now - timedelta(seconds=1))
+    alias3_value = alias3.value
+    session.bulk_save_objects([alias1, alias2, alias3])
+    session.commit()
 
+    persistent_store = AliasStore()
     volatile_store = AliasStore(60)
-    alias2 = make_alias(False)
-    volatile_store.save(alias2)
-
-    alias3 = make_alias(False)
-    AliasStore(-1).save(alias3)
-    alias3_value = alias3.value
 
     assert AliasStore.cleanup() == 1
     persistent_store.get_by_value(alias1.value) is not None
@@ -2,6 +2,7 @@ import socket
 from tempfile import NamedTemporaryFile
 
 import pytest
+from sqlalchemy import event
 
 from satellite import db
 
@@ -11,6 +12,53 @@ def snapshot_pytest_unitest_bridge(request):
     request.cls.snapshot_should_update = request.config.option.snapshot_update
 
 
+@pytest.fixture(autouse=True)
+def db_session():
+    # Every test runs in a single outer transaction which is rolled back at
+    # the end. Commits made by the code under test only release a savepoint.
+    # The thread-local session is rebound rather than replaced since
+    # factories keep a reference to it.
+    engine = db.get_engine()
+    connection = engine.connect()
+    # pysqlite begins transactions implicitly on DML only and so breaks
+    # savepoints. For this connection the driver-level transaction handling
+    # is turned off and BEGIN is emitted explicitly. The trade-off is that
+    # sessions in tests don't run with the production (implicit) pysqlite
+    # transaction behavior. Other connections of the engine are unaffected
+    # and the isolation level is reset by the pool on checkin.
+    connection.execution_options(isolation_level='AUTOCOMMIT')
+    event.listen(connection, 'begin', _emit_begin)
+    transaction = connection.begin()
+
+    session = db.get_session()
+    session.close()
+    session.bind = connection
+    session.begin_nested()
+
+    def restart_savepoint(session, transaction):
+        if transaction.nested and not transaction.parent.nested:
+            session.expire_all()
+            session.begin_nested()
+
+    event.listen(session, 'after_transaction_end', restart_savepoint)
+
+    yield session
+
+    event.remove(session, 'after_transaction_end', restart_savepoint)
+    # The savepoint must be rolled back explicitly: session.close() leaves it
+    # open and rolling back the outer transaction under it leaves the pool
+    # reset agent inactive.
+    session.rollback()
+    session.close()
+    session.bind = engine
+    transaction.rollback()
+    connection.close()
+
+
+def _emit_begin(connection):
+    connection.execute('BEGIN')
+
+
 @pytest.fixture
 def free_port():
     s = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
@@ -1,3 +1,5 @@
+from pathlib import Path
+from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
 import pytest
@@ -19,6 +21,16 @@ class BaseHandlerTestCase(AsyncHTTPTestCase, TestCase):
         create_proxy_patch.start()
         self.addCleanup(create_proxy_patch.stop)
 
+        # Tests must not write into the user's satellite dir.
+        spec_cache_dir = TemporaryDirectory()
+        self.addCleanup(spec_cache_dir.cleanup)
+        spec_cache_path_patch = patch(
+            'satellite.web_application.SPEC_CACHE_PATH',
+            Path(spec_cache_dir.name) / 'spec.cache.json',
+        )
+        spec_cache_path_patch.start()
+        self.addCleanup(spec_cache_path_patch.stop)
+
         super().setUp()
 
     def get_app(self):
@@ -12,7 +12,7 @@ snapshots['TestAliasHandler::test_get_ok 1'] = {
         {
             'aliases': [
                 {
-                    'alias': 'tok_sat_P7umYP6NSb9QtHDMgi96Tt',
+                    'alias': 'tok_sat_RKJthjddprwQUScP3Ygu3j',
                     'format': 'UUID'
                 }
             ],
@@ -53,10 +53,10 @@ snapshots['TestAliasesHandler::test_get_ok 1'] = {
 
 snapshots['TestAliasesHandler::test_get_unknown_alias 1'] = {
     'data': {
-        'tok_sat_P7umYP6NSb9QtHDMgi96Tt': {
+        'tok_sat_kFzBVeLLtBr9Rp8wxHfJCr': {
             'aliases': [
                 {
-                    'alias': 'tok_sat_P7umYP6NSb9QtHDMgi96Tt',
+                    'alias': 'tok_sat_kFzBVeLLtBr9Rp8wxHfJCr',
                     'format': 'UUID'
                 }
             ],
@@ -75,7 +75,7 @@ snapshots['TestAliasesHandler::test_post_ok 1'] = {
         {
             'aliases': [
                 {
-                    'alias': 'tok_sat_P7umYP6NSb9QtHDMgi96Tt',
+                    'alias': 'tok_sat_Rm454UAJbVTYfqXbXBjNYc',
                     'format': 'UUID'
                 }
             ],
@@ -85,7 +85,7 @@ snapshots['TestAliasesHandler::test_post_ok 1'] = {
         {
             'aliases': [
                 {
-                    'alias': 'tok_sat_Rm454UAJbVTYfqXbXBjNYc',
+                    'alias': 'tok_sat_n1gSHeQV5bcrN7QvjNWyc6',
                     'format': 'UUID'
                 }
             ],
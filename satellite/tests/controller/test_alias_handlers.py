@@ -18,6 +18,8 @@ class TestAliasesHandler(BaseHandlerTestCase):
                 side_effect=[
                     'c20b81b0-d90d-42d1-bf6d-eea5e6981196',
                     '884a0c8e-de04-46de-945a-c77c3acf783e',
+                    '0d1a1b8e-4c3d-4f43-9e0a-5b8a3a5e1b1f',
+                    'f4b2b2a1-8c65-4d6e-a5a8-2f4c2a0f6c3d',
                 ]
             ),
         )
@@ -0,0 +1,69 @@
+import asyncio
+import json
+from threading import Thread
+from unittest.mock import patch
+
+import yaml
+
+from satellite.proxy import ProxyMode, events
+from .base import BaseHandlerTestCase
+
+
+class TestSpecHandlers(BaseHandlerTestCase):
+    def test_get_json(self):
+        response = self.fetch(self.get_url('/spec.json'))
+
+        self.assertEqual(response.code, 200, response.body)
+        spec = json.loads(response.body)
+        self.assertIn('/aliases', spec['paths'])
+
+    def test_get_yaml(self):
+        response = self.fetch(self.get_url('/spec.yaml'))
+
+        self.assertEqual(response.code, 200, response.body)
+        self.assertEqual(response.headers['Content-Type'], 'text/yaml')
+        spec = yaml.safe_load(response.body)
+        self.assertIn('/aliases', spec['paths'])
+
+    def test_allowed_methods(self):
+        response = self.fetch(self.get_url('/spec.json'))
+        self.assertEqual(
+            response.headers['Access-Control-Allow-Methods'],
+            'GET, OPTIONS',
+        )
+
+
+class TestNotFoundHandler(BaseHandlerTestCase):
+    def test_unknown_uri(self):
+        response = self.fetch(self.get_url('/unknown?q=1'))
+
+        self.assertEqual(response.code, 404, response.body)
+        self.assertEqual(
+            json.loads(response.body),
+            {'error': {'message': 'Unknown URI: /unknown?q=1', 'reason': 'Not found'}},
+        )
+
+
+class TestProxyEvents(BaseHandlerTestCase):
+    def test_event_is_processed_in_loop(self):
+        event = events.FlowRemoveEvent(
+            proxy_mode=ProxyMode.FORWARD,
+            flow_id='flow-id',
+        )
+        # Normally set by start() which runs the loop forever.
+        self._app._loop = self.io_loop.asyncio_loop
+        with patch(
+            'satellite.controller.websocket_connection.ClientConnection.broadcast',
+        ) as broadcast:
+            thread = Thread(target=self._app._proxy_event_handler, args=(event,))
+            thread.start()
+            thread.join()
+            broadcast.assert_not_called()
+
+            self.io_loop.run_sync(lambda: asyncio.sleep(0))
+
+        broadcast.assert_called_once_with(
+            resource='flows',
+            cmd='remove',
+            data='flow-id',
+        )
@@ -251,9 +251,9 @@ def test_audit_logs(monkeypatch):
             proxy_mode=ProxyMode.FORWARD,
         )
         event_queue.put(
-            events.AuditLogEvent(
+            events.AuditLogsEvent(
                 proxy_mode=ProxyMode.FORWARD,
-                record=record,
+                records=[record],
             )
         )
         time.sleep(0.1)
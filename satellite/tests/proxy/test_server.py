@@ -0,0 +1,42 @@
+from unittest.mock import patch
+
+from mitmproxy.options import Options
+from mitmproxy.proxy.config import ProxyConfig
+
+from satellite.proxy.server import ProxyServer
+
+
+@patch('satellite.proxy.server.route_manager')
+def test_upstream_cache(route_manager_mock, free_port):
+    route_manager_mock.get_inbound_upstream.return_value = 'https://httpbin.org'
+
+    server = ProxyServer(ProxyConfig(Options(listen_port=free_port)))
+    try:
+        assert server._get_upstream() == 'https://httpbin.org'
+        route_manager_mock.get_inbound_upstream.return_value = None
+        assert server._get_upstream() == 'https://httpbin.org'
+        route_manager_mock.get_inbound_upstream.assert_called_once()
+
+        with patch('satellite.proxy.server.UPSTREAM_CACHE_TTL', -1):
+            server._upstream_cache = None
+            assert server._get_upstream() is None
+            assert server._get_upstream() is None
+        assert route_manager_mock.get_inbound_upstream.call_count == 3
+    finally:
+        server.socket.close()
+
+
+def test_reverse_config_cache(free_port):
+    server = ProxyServer(ProxyConfig(Options(listen_port=free_port)))
+    try:
+        config = server._get_reverse_config('https://httpbin.org')
+        assert config.options.mode == 'reverse:https://httpbin.org'
+        assert server._get_reverse_config('https://httpbin.org') is config
+
+        other_config = server._get_reverse_config('https://example.com')
+        assert other_config.options.mode == 'reverse:https://example.com'
+        assert server._get_reverse_config('https://example.com') is other_config
+
+        assert server._get_reverse_config('https://httpbin.org') is not config
+    finally:
+        server.socket.close()
@@ -9,3 +9,18 @@ def test_replace():
     route_manager.replace([new_route.__dict__])
     assert route_manager.get(old_route.id) is None
     assert route_manager.get(new_route.id) is not None
+
+
+def test_get_inbound_upstream():
+    route_manager.replace([])
+    assert route_manager.get_inbound_upstream() is None
+
+    outbound_route = RouteFactory.stub()
+    route_manager.create(outbound_route.__dict__)
+    assert route_manager.get_inbound_upstream() is None
+
+    inbound_route = RouteFactory.stub(
+        destination_override_endpoint='https://httpbin.org',
+    )
+    route_manager.create(inbound_route.__dict__)
+    assert route_manager.get_inbound_upstream() == 'https://httpbin.org'
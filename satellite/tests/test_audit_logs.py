@@ -1,9 +1,11 @@
+import asyncio
 import dataclasses
 from unittest.mock import Mock
 
 import pytest
 
 from satellite.audit_logs import emit, subscribe
+from satellite.audit_logs.buffer import AuditLogBuffer
 from satellite.audit_logs.records import AuditLogRecord
 from satellite.audit_logs.store import AuditLogStore, UnknownFlowIdError
 from satellite.proxy import ProxyMode
@@ -59,3 +61,39 @@ def test_store_get_error():
     with pytest.raises(UnknownFlowIdError) as exc_info:
         store.get('flow-id')
     assert str(exc_info.value) == 'Requested audit logs for unknown flow ID: flow-id'
+
+
+def test_buffer_flush_on_capacity():
+    flush_callback = Mock()
+    buffer = AuditLogBuffer(flush_callback, capacity=2, flush_interval=60)
+    records = [
+        AuditLogTestRecord(flow_id='flow-id', proxy_mode=ProxyMode.REVERSE)
+        for _ in range(3)
+    ]
+
+    async def run():
+        for record in records:
+            buffer.add(record)
+
+    asyncio.get_event_loop().run_until_complete(run())
+    flush_callback.assert_called_once_with(records[:2])
+
+    buffer.flush()
+    flush_callback.assert_called_with(records[2:])
+
+
+def test_buffer_flush_on_interval():
+    flush_callback = Mock()
+    buffer = AuditLogBuffer(flush_callback, flush_interval=0.01)
+    record = AuditLogTestRecord(flow_id='flow-id', proxy_mode=ProxyMode.REVERSE)
+
+    async def run():
+        buffer.add(record)
+        flush_callback.assert_not_called()
+        await asyncio.sleep(0.05)
+
+    asyncio.get_event_loop().run_until_complete(run())
+    flush_callback.assert_called_once_with([record])
+
+    buffer.flush()
+    flush_callback.assert_called_once()
@@ -1,9 +1,9 @@
 import dataclasses
+import os
 from pathlib import Path
 from types import MappingProxyType
 
 import pytest
-from ruamel.yaml import YAML
 
 from satellite.config import InvalidConfigError, configure
 
@@ -14,6 +14,7 @@ DEFAULT_CONFIG_VALUES = MappingProxyType(
         'debug': False,
         'forward_proxy_port': 9099,
         'log_path': None,
+        'log_sink': 'file',
         'reverse_proxy_port': 9098,
         'routes_path': None,
         'silent': False,
@@ -24,11 +25,16 @@ DEFAULT_CONFIG_VALUES = MappingProxyType(
 
 
 def _write_config(config_path: Path, raw_data: str = None, **kwargs):
-    with open(config_path, 'w') as stream:
-        if raw_data:
-            stream.write(raw_data)
-        else:
-            YAML().dump(kwargs, stream)
+    if not raw_data:
+        # repr() gives valid YAML for ints, bools and strings without escapes
+        # only. E.g. repr(None) is read as 'None' string by YAML.
+        for key, value in kwargs.items():
+            if not isinstance(value, (int, str)) or (
+                isinstance(value, str) and repr(value) != f"'{value}'"
+            ):
+                raise ValueError(f'Unsupported config value {key}={value!r}.')
+        raw_data = '\n'.join(f'{key}: {value!r}' for key, value in kwargs.items())
+    config_path.write_text(raw_data)
 
 
 def test_defaults(monkeypatch, tmp_path):
@@ -85,8 +91,41 @@ def test_invalid_config_data(monkeypatch, tmp_path):
         configure()
 
 
+def test_invalid_log_sink(monkeypatch, tmp_path):
+    monkeypatch.setattr(
+        'satellite.config.DEFAULT_CONFIG_PATH',
+        tmp_path / 'config.yml',
+    )
+    assert configure(log_sink='syslog').log_sink == 'syslog'
+    with pytest.raises(InvalidConfigError):
+        configure(log_sink='invalid')
+
+
 def test_invalid_config_args(monkeypatch, tmp_path):
     config_path = tmp_path / 'config.yml'
     monkeypatch.setattr('satellite.config.DEFAULT_CONFIG_PATH', config_path)
     with pytest.raises(InvalidConfigError):
         configure(web_server_port='invalid')
+
+
+def test_config_file_cache(monkeypatch, tmp_path):
+    config_path = tmp_path / 'config.yml'
+    _write_config(config_path, web_server_port=1)
+    monkeypatch.setattr('satellite.config.DEFAULT_CONFIG_PATH', config_path)
+    assert configure().web_server_port == 1
+    assert (tmp_path / 'config.yml.cache.json').exists()
+
+    with monkeypatch.context() as m:
+        m.setattr('satellite.config.yaml', None)
+        assert configure().web_server_port == 1
+
+    _write_config(config_path, web_server_port=2)
+    stat = config_path.stat()
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1))
+    assert configure().web_server_port == 2
+
+    # Same mtime, different size
+    stat = config_path.stat()
+    _write_config(config_path, web_server_port=30)
+    os.utime(config_path, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert configure().web_server_port == 30
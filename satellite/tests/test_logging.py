@@ -0,0 +1,167 @@
+import logging
+import logging.handlers
+import socket
+import sys
+import time
+from unittest.mock import Mock
+
+import pytest
+
+from satellite import logging as satellite_logging
+
+
+@pytest.fixture
+def root_logger():
+    root = logging.getLogger()
+    handlers = root.handlers
+    level = root.level
+    root.handlers = []
+    try:
+        yield root
+    finally:
+        satellite_logging.stop()
+        root.handlers = handlers
+        root.setLevel(level)
+
+
+def test_queue_handler(root_logger, tmp_path):
+    log_path = tmp_path / 'satellite.log'
+    satellite_logging.configure(log_path=str(log_path), silent=True)
+
+    assert len(_get_queue_handlers(root_logger)) == 1
+
+    root_logger.info('Message %d.', 1)
+    satellite_logging.stop()
+
+    content = log_path.read_text()
+    assert content.startswith('[INFO][')
+    assert content.endswith('] Message 1.\n')
+
+
+def test_formatter():
+    try:
+        raise ValueError('Test error')
+    except ValueError:
+        record = _make_record(
+            logging.ERROR,
+            'Message %s.',
+            'arg',
+            exc_info=sys.exc_info(),
+        )
+
+    base_formatter = logging.Formatter(satellite_logging.LOG_FORMAT)
+    assert satellite_logging.Formatter().format(record) == base_formatter.format(record)
+
+
+def test_buffered_file_handler(tmp_path):
+    log_path = tmp_path / 'satellite.log'
+    handler = satellite_logging.BufferedFileHandler(
+        str(log_path),
+        capacity=2,
+        flush_interval=60,
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        handler.handle(_make_record(logging.INFO, 'first'))
+        assert log_path.read_text() == ''
+
+        handler.handle(_make_record(logging.INFO, 'second'))
+        assert log_path.read_text() == 'first\nsecond\n'
+
+        handler.handle(_make_record(logging.ERROR, 'error'))
+        assert log_path.read_text() == 'first\nsecond\nerror\n'
+
+        handler.handle(_make_record(logging.INFO, 'last'))
+    finally:
+        handler.close()
+
+    assert log_path.read_text() == 'first\nsecond\nerror\nlast\n'
+
+
+def test_buffered_file_handler_flushes_stream_once_per_batch(tmp_path):
+    log_path = tmp_path / 'satellite.log'
+    handler = satellite_logging.BufferedFileHandler(
+        str(log_path),
+        capacity=100,
+        flush_interval=60,
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        stream = handler.target.stream = Mock(wraps=handler.target.stream)
+
+        for index in range(99):
+            handler.handle(_make_record(logging.INFO, str(index)))
+        stream.flush.assert_not_called()
+
+        handler.flush()
+        assert stream.write.call_count == 99
+        stream.flush.assert_called_once()
+        assert log_path.read_text() == ''.join(f'{index}\n' for index in range(99))
+    finally:
+        handler.close()
+
+
+def test_buffered_file_handler_periodic_flush(tmp_path):
+    log_path = tmp_path / 'satellite.log'
+    handler = satellite_logging.BufferedFileHandler(
+        str(log_path),
+        flush_interval=0.01,
+    )
+    handler.setFormatter(logging.Formatter('%(message)s'))
+    try:
+        handler.handle(_make_record(logging.INFO, 'message'))
+        deadline = time.monotonic() + 5
+        while not log_path.read_text() and time.monotonic() < deadline:
+            time.sleep(0.01)
+        assert log_path.read_text() == 'message\n'
+    finally:
+        handler.close()
+
+
+def test_syslog_sink(root_logger, tmp_path, caplog):
+    log_path = tmp_path / 'satellite.log'
+    satellite_logging.configure(
+        log_path=str(log_path),
+        silent=True,
+        log_sink='syslog',
+    )
+
+    handlers = satellite_logging._listener.handlers
+    assert len(handlers) == 1
+    assert isinstance(handlers[0], logging.handlers.SysLogHandler)
+    assert not log_path.exists()
+    assert f'Log path {log_path} is ignored for syslog log sink.' in caplog.messages
+
+
+def test_syslog_sink_udp_fallback(root_logger, monkeypatch, caplog):
+    monkeypatch.setattr('satellite.logging.Path.exists', lambda _: False)
+    satellite_logging.configure(silent=True, log_sink='syslog')
+
+    assert satellite_logging._listener.handlers[0].socktype == socket.SOCK_DGRAM
+    assert (
+        'Local syslog socket is not found, sending logs to localhost:514 via UDP.'
+        in caplog.messages
+    )
+
+
+def test_no_handlers(root_logger):
+    satellite_logging.configure(silent=True)
+    assert _get_queue_handlers(root_logger) == []
+
+
+def _make_record(
+    level: int,
+    msg: str,
+    *args,
+    exc_info=None,
+) -> logging.LogRecord:
+    return logging.LogRecord('test', level, __file__, 0, msg, args, exc_info)
+
+
+def _get_queue_handlers(logger: logging.Logger):
+    # pytest adds its own capturing handlers into the root logger.
+    return [
+        handler
+        for handler in logger.handlers
+        if isinstance(handler, logging.handlers.QueueHandler)
+    ]
@@ -0,0 +1,44 @@
+from unittest.mock import patch
+
+from satellite.spec import build_openapi_spec, load_openapi_spec
+from satellite.controller.route_handlers import RoutesHandler
+
+
+HANDLERS = [(r'/route', RoutesHandler)]
+
+
+def test_load_openapi_spec_cache(tmp_path):
+    cache_path = tmp_path / 'spec.cache.json'
+
+    spec = load_openapi_spec(HANDLERS, cache_path)
+    assert spec['paths']['/route']
+    assert cache_path.exists()
+
+    with patch('satellite.spec.build_openapi_spec') as build_spec_mock:
+        assert load_openapi_spec(HANDLERS, cache_path) == spec
+        build_spec_mock.assert_not_called()
+
+    with patch(
+        'satellite.spec.build_openapi_spec',
+        wraps=build_openapi_spec,
+    ) as build_spec_mock:
+        assert load_openapi_spec(HANDLERS[:0], cache_path)['paths'] == {}
+        build_spec_mock.assert_called_once()
+
+
+def test_load_openapi_spec_without_cache():
+    spec = load_openapi_spec(HANDLERS)
+    assert list(spec['paths']) == ['/route']
+
+
+def test_load_openapi_spec_cache_dependencies(tmp_path):
+    cache_path = tmp_path / 'spec.cache.json'
+    spec = load_openapi_spec(HANDLERS, cache_path)
+
+    version_patch = patch('satellite.spec.metadata.version', return_value='0.0.0')
+    with version_patch, patch(
+        'satellite.spec.build_openapi_spec',
+        wraps=build_openapi_spec,
+    ) as build_spec_mock:
+        assert load_openapi_spec(HANDLERS, cache_path) == spec
+        build_spec_mock.assert_called_once()
@@ -33,7 +33,7 @@ def transform(flow: HTTPFlow, phase: Phase, rule_entry: RuleEntry) -> bool:
                 store_type=AliasStoreType(rule_entry.token_manager),
             ).value
         except RevealFailed as exc:
-            logger.warning(f'Unable to reveal alias {value}: {exc}')
+            logger.warning('Unable to reveal alias %s: %s', value, exc)
             return value
 
     config = TransformerConfig(
@@ -1,14 +1,15 @@
 import asyncio
 import logging
 import signal
-from functools import partial
+from functools import lru_cache
 from pathlib import Path
 
 from tornado import autoreload
 from tornado.ioloop import IOLoop
-from tornado.web import Application, StaticFileHandler
+from tornado.web import Application, StaticFileHandler, url
 
-from .config import SatelliteConfig
+from . import logging as satellite_logging
+from .config import SATELLITE_DIR, SatelliteConfig
 from .controller import (
     BaseHandler,
     alias_handlers,
@@ -19,11 +20,12 @@ from .controller.exceptions import NotFoundError
 from .controller.route_handlers import RouteHandler, RoutesHandler
 from .controller.websocket_connection import ClientConnection
 from .proxy.manager import ProxyManager
-from .spec import build_openapi_spec
 
 
 logger = logging.getLogger()
 
+SPEC_CACHE_PATH = SATELLITE_DIR / 'spec.cache.json'
+
 
 class IndexHandler(BaseHandler):
     def head(self):
@@ -32,13 +34,15 @@ class IndexHandler(BaseHandler):
 
 class SpecJSONHandler(BaseHandler):
     def get(self):
-        self.finish(self.application.spec.to_dict())
+        self.finish(self.application.spec)
 
 
 class SpecYAMLHandler(BaseHandler):
     def get(self):
+        from apispec.yaml_utils import dict_to_yaml
+
         self.set_header('Content-Type', 'text/yaml')
-        self.finish(self.application.spec.to_yaml())
+        self.finish(dict_to_yaml(self.application.spec))
 
 
 class NotFoundHandler(BaseHandler):
@@ -52,74 +56,91 @@ class NotFoundHandler(BaseHandler):
         pass
 
 
+# URL specs are compiled once and shared by all the app instances.
+_API_HANDLERS = (
+    url(r'/aliases', alias_handlers.AliasesHandler),
+    url(r'/aliases/(?P<public_alias>.+)', alias_handlers.AliasHandler),
+    url(r'/flows', flow_handlers.Flows),
+    url(r'/flows/(?P<flow_id>[^/]+)', flow_handlers.FlowHandler),
+    url(r'/flows/(?P<flow_id>[^/]+)/duplicate', flow_handlers.DuplicateFlow),
+    url(r'/flows/(?P<flow_id>[^/]+)/replay', flow_handlers.ReplayFlow),
+    url(r'/logs/(?P<flow_id>[^/]+)', audit_logs_handler.AuditLogsHandler),
+    url(r'/route', RoutesHandler),
+    url(r'/route/(?P<route_id>[^/]+)', RouteHandler),
+)
+
+_HANDLERS = (
+    url(r'/', IndexHandler),
+    url(r'/flows.json', flow_handlers.Flows),
+    url(r'/spec.json', SpecJSONHandler),
+    url(r'/spec.yaml', SpecYAMLHandler),
+    url(r'/updates', ClientConnection),
+    url(
+        r'/apidocs/?(.*)',
+        StaticFileHandler,
+        {
+            'default_filename': 'index.html',
+            'path': Path(__file__).parent / 'static' / 'swagger',
+        },
+    ),
+)
+
+
+@lru_cache(maxsize=1)
+def _get_openapi_spec() -> dict:
+    # Spec building machinery is imported on the first use only since the
+    # spec is usually loaded from the cache.
+    from .spec import load_openapi_spec
+
+    return load_openapi_spec(_API_HANDLERS, SPEC_CACHE_PATH)
+
+
 class WebApplication(Application):
     def __init__(self, config: SatelliteConfig = None):
         self.config = config or SatelliteConfig()
 
-        api_handlers = [
-            (r'/aliases', alias_handlers.AliasesHandler),
-            (r'/aliases/(?P<public_alias>.+)', alias_handlers.AliasHandler),
-            (r'/flows', flow_handlers.Flows),
-            (r'/flows/(?P<flow_id>[^/]+)', flow_handlers.FlowHandler),
-            (r'/flows/(?P<flow_id>[^/]+)/duplicate', flow_handlers.DuplicateFlow),
-            (r'/flows/(?P<flow_id>[^/]+)/replay', flow_handlers.ReplayFlow),
-            (r'/logs/(?P<flow_id>[^/]+)', audit_logs_handler.AuditLogsHandler),
-            (r'/route', RoutesHandler),
-            (r'/route/(?P<route_id>[^/]+)', RouteHandler),
-        ]
-
-        self.spec = build_openapi_spec(api_handlers)
+        self.spec = _get_openapi_spec()
 
         super().__init__(
-            handlers=[
-                *api_handlers,
-                (r'/', IndexHandler),
-                (r'/flows.json', flow_handlers.Flows),
-                (r'/spec.json', SpecJSONHandler),
-                (r'/spec.yaml', SpecYAMLHandler),
-                (r'/updates', ClientConnection),
-                (
-                    r'/apidocs/?(.*)',
-                    StaticFileHandler,
-                    {
-                        'default_filename': 'index.html',
-                        'path': Path(__file__).parent / 'static' / 'swagger',
-                    },
-                ),
-            ],
+            handlers=[*_API_HANDLERS, *_HANDLERS],
             debug=self.config.debug,
             default_handler_class=NotFoundHandler,
         )
 
         self._should_exit = False
 
+        # Set on start since the app may be created before the loop it will
+        # be run in.
+        self._loop: asyncio.AbstractEventLoop = None
+
         self.proxy_manager = ProxyManager(
             forward_proxy_port=self.config.forward_proxy_port,
             reverse_proxy_port=self.config.reverse_proxy_port,
-            event_handler=partial(
-                self._proxy_event_handler,
-                loop=asyncio.get_event_loop(),
-            ),
+            event_handler=self._proxy_event_handler,
         )
 
-    def _proxy_event_handler(self, event, loop):
-        asyncio.run_coroutine_threadsafe(
-            ClientConnection.process_proxy_event(event),
-            loop,
+    def _proxy_event_handler(self, event):
+        # Called from the proxy event listener thread.
+        self._loop.call_soon_threadsafe(
+            ClientConnection.process_proxy_event_nowait,
+            event,
         )
 
     def start(self):
         loop = asyncio.get_event_loop()
+        self._loop = loop
         for sig in [signal.SIGINT, signal.SIGTERM]:
             loop.add_signal_handler(sig, self.stop)
 
         if self.settings.get('autoreload'):
             autoreload.add_reload_hook(self.proxy_manager.stop)
+            # Buffered log records would be lost on execv otherwise
+            autoreload.add_reload_hook(satellite_logging.stop)
 
         self.proxy_manager.start()
 
         self.listen(self.config.web_server_port)
-        logger.info(f'Web server listening at {self.config.web_server_port} port.')
+        logger.info('Web server listening at %d port.', self.config.web_server_port)
         IOLoop.current().start()
 
     def stop(self):